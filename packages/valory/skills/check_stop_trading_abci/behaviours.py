@@ -19,14 +19,16 @@
 
 """This module contains the behaviours for the check stop trading skill."""
 
-import math
 from typing import Generator, Set, Type, cast
 
 from packages.valory.contracts.mech.contract import Mech as MechContract
 from packages.valory.skills.abstract_round_abci.base import get_name
 from packages.valory.skills.abstract_round_abci.behaviour_utils import BaseBehaviour
 from packages.valory.skills.abstract_round_abci.behaviours import AbstractRoundBehaviour
-from packages.valory.skills.check_stop_trading_abci.models import CheckStopTradingParams
+from packages.valory.skills.check_stop_trading_abci.models import (
+    CheckStopTradingParams,
+    SharedState,
+)
 from packages.valory.skills.check_stop_trading_abci.payloads import (
     CheckStopTradingPayload,
 )
@@ -86,6 +88,34 @@ class CheckStopTradingBehaviour(StakingInteractBaseBehaviour):
         """Return the params."""
         return cast(CheckStopTradingParams, self.context.params)
 
+    @property
+    def shared_state(self) -> SharedState:
+        """Return the shared state."""
+        return cast(SharedState, self.context.state)
+
+    def _get_liveness_values(self) -> Generator[None, None, None]:
+        """Get the liveness period and ratio, reusing the cached values if they are still valid.
+
+        The liveness period and ratio only change at checkpoint transitions.
+        Therefore, the last checkpoint's timestamp is used as the cache's key,
+        which allows us to skip two contract reads per period in the common case.
+
+        :yield: None
+        """
+        cached = self.shared_state.staking_cache.get(self.staking_contract_address)
+        if cached is not None and cached[0] == self.ts_checkpoint:
+            _, self.liveness_period, self.liveness_ratio = cached
+            return
+
+        yield from self.gather_conditions(
+            self._get_liveness_period, self._get_liveness_ratio
+        )
+        self.shared_state.staking_cache[self.staking_contract_address] = (
+            self.ts_checkpoint,
+            self.liveness_period,
+            self.liveness_ratio,
+        )
+
     def is_staking_kpi_met(self) -> Generator[None, None, bool]:
         """Return whether the staking KPI has been met (only for staked services)."""
         yield from self.wait_for_condition_with_sleep(self._check_service_staked)
@@ -93,23 +123,23 @@ class CheckStopTradingBehaviour(StakingInteractBaseBehaviour):
         if self.service_staking_state != StakingState.STAKED:
             return False
 
-        yield from self.wait_for_condition_with_sleep(self._get_mech_request_count)
+        yield from self.gather_conditions(
+            self._get_mech_request_count,
+            self._get_service_info,
+            self._get_ts_checkpoint,
+        )
         mech_request_count = self.mech_request_count
         self.context.logger.debug(f"{self.mech_request_count=}")
 
-        yield from self.wait_for_condition_with_sleep(self._get_service_info)
         mech_request_count_on_last_checkpoint = self.service_info[2][1]
         self.context.logger.debug(f"{mech_request_count_on_last_checkpoint=}")
 
-        yield from self.wait_for_condition_with_sleep(self._get_ts_checkpoint)
         last_ts_checkpoint = self.ts_checkpoint
         self.context.logger.debug(f"{last_ts_checkpoint=}")
 
-        yield from self.wait_for_condition_with_sleep(self._get_liveness_period)
+        yield from self._get_liveness_values()
         liveness_period = self.liveness_period
         self.context.logger.debug(f"{liveness_period=}")
-
-        yield from self.wait_for_condition_with_sleep(self._get_liveness_ratio)
         liveness_ratio = self.liveness_ratio
         self.context.logger.debug(f"{liveness_ratio=}")
 
@@ -121,12 +151,11 @@ class CheckStopTradingBehaviour(StakingInteractBaseBehaviour):
         current_timestamp = self.synced_timestamp
         self.context.logger.debug(f"{current_timestamp=}")
 
+        # ceiling division in integer arithmetic,
+        # to avoid float rounding errors on the chain's uint256 values
+        duration = max(liveness_period, current_timestamp - last_ts_checkpoint)
         required_mech_requests = (
-            math.ceil(
-                max(liveness_period, (current_timestamp - last_ts_checkpoint))
-                * liveness_ratio
-                / LIVENESS_RATIO_SCALE_FACTOR
-            )
+            -(-(duration * liveness_ratio) // LIVENESS_RATIO_SCALE_FACTOR)
             + REQUIRED_MECH_REQUESTS_SAFETY_MARGIN
         )
         self.context.logger.debug(f"{required_mech_requests=}")
@@ -148,14 +177,13 @@ class CheckStopTradingBehaviour(StakingInteractBaseBehaviour):
         if self.params.disable_trading:
             return True
 
-        stop_trading_conditions = []
         self.context.logger.debug(f"{self.params.stop_trading_if_staking_kpi_met=}")
         if self.params.stop_trading_if_staking_kpi_met:
             staking_kpi_met = yield from self.is_staking_kpi_met()
             self.context.logger.debug(f"{staking_kpi_met=}")
-            stop_trading_conditions.append(staking_kpi_met)
+            return staking_kpi_met
 
-        return any(stop_trading_conditions)
+        return False
 
     def async_act(self) -> Generator:
         """Do the action."""
@@ -20,8 +20,9 @@
 
 """Models for the check stop trading ABCI application."""
 
-from typing import Any
+from typing import Any, Dict, Tuple, Type
 
+from packages.valory.skills.abstract_round_abci.base import AbciApp
 from packages.valory.skills.abstract_round_abci.models import (
     BenchmarkTool as BaseBenchmarkTool,
 )
@@ -54,4 +55,11 @@ class CheckStopTradingParams(StakingParams):
 class SharedState(BaseSharedState):
     """Keep the current shared state of the skill."""
 
-    abci_app_cls = CheckStopTradingAbciApp
+    abci_app_cls: Type[AbciApp] = CheckStopTradingAbciApp
+
+    def __init__(self, *args: Any, skill_context: Any = None, **kwargs: Any) -> None:
+        """Initialize the state."""
+        super().__init__(*args, skill_context=skill_context, **kwargs)
+        # staking values which only change at checkpoint transitions,
+        # mapping the staking contract address to `(ts_checkpoint, liveness_period, liveness_ratio)`
+        self.staking_cache: Dict[str, Tuple[int, int, int]] = {}
@@ -699,6 +699,7 @@ class BaseSubscriptionBehaviour(DecisionMakerBaseBehaviour, ABC):
         """Initialize `BaseSubscriptionBehaviour`."""
         super().__init__(**kwargs)
         self.balance: int = 0
+        self._did_doc_cache: Dict[str, Dict[str, Any]] = {}
 
     @property
     def escrow_payment_condition_address(self) -> str:
@@ -761,7 +762,18 @@ class BaseSubscriptionBehaviour(DecisionMakerBaseBehaviour, ABC):
         return subscription_params["base_url"]
 
     def _resolve_did(self) -> Generator[None, None, Optional[Dict[str, Any]]]:
-        """Resolve and parse the did."""
+        """Resolve and parse the did.
+
+        The resolved documents are cached per did for the behaviour's lifetime,
+        as they do not change within a round.
+
+        :return: the did's document, or `None` if the resolution failed.
+        :yield: None
+        """
+        did_doc = self._did_doc_cache.get(self.did)
+        if did_doc is not None:
+            return did_doc
+
         did_url = f"{self.base_url}/{self.did}"
         response = yield from self.get_http_response(
             method="GET",
@@ -783,6 +795,7 @@ class BaseSubscriptionBehaviour(DecisionMakerBaseBehaviour, ABC):
             )
             return None
 
+        self._did_doc_cache[self.did] = data
         return data
 
     def _get_nft_balance(
@@ -18,7 +18,7 @@
 # ------------------------------------------------------------------------------
 
 """This module contains the behaviour for the decision-making of the skill."""
-from typing import Any, Dict, Generator, List, Optional, cast
+from typing import Any, Dict, Generator, List, Optional, Tuple, cast
 
 from hexbytes import HexBytes
 
@@ -61,8 +61,10 @@ class OrderSubscriptionBehaviour(BaseSubscriptionBehaviour):
     def __init__(self, **kwargs: Any) -> None:
         """Initialize `RedeemBehaviour`."""
         super().__init__(**kwargs)
-        self.order_tx: str = ""
-        self.approval_tx: str = ""
+        # the contract adapters return the prepared transactions' data already decoded as bytes,
+        # so it can be used in the multisend batches directly, without re-wrapping it in `HexBytes`
+        self.order_tx: bytes = b""
+        self.approval_tx: bytes = b""
         self.balance: int = 0
         self.agreement_id: str = ""
         self.credits_per_req: int = 0
@@ -70,8 +72,8 @@ class OrderSubscriptionBehaviour(BaseSubscriptionBehaviour):
 
     def _get_condition_ids(
         self, agreement_id_seed: str, did_doc: Dict[str, Any]
-    ) -> List[str]:
-        """Get the condition ids."""
+    ) -> Tuple[List[str], List[str], List[int]]:
+        """Get the condition ids, along with the receivers and the amounts of the price."""
         self.agreement_id = get_agreement_id(
             agreement_id_seed, self.synchronized_data.safe_contract_address
         )
@@ -115,7 +117,7 @@ class OrderSubscriptionBehaviour(BaseSubscriptionBehaviour):
             transfer_nft_condition_seed,
             escrow_payment_seed,
         ]
-        return condition_ids
+        return condition_ids, receivers, amounts
 
     def _get_purchase_params(self) -> Generator[None, None, Optional[Dict[str, Any]]]:
         """Get purchase params."""
@@ -125,11 +127,10 @@ class OrderSubscriptionBehaviour(BaseSubscriptionBehaviour):
         if did_doc is None:
             # something went wrong
             return None
-        condition_ids = self._get_condition_ids(agreement_id, did_doc)
+        condition_ids, receivers, amounts = self._get_condition_ids(
+            agreement_id, did_doc
+        )
         timeouts, timelocks = get_timeouts_and_timelocks(did_doc)
-        price = get_price(did_doc)
-        receivers = list(price.keys())
-        amounts = list(price.values())
 
         return {
             "agreement_id": agreement_id,
@@ -222,7 +223,7 @@ class OrderSubscriptionBehaviour(BaseSubscriptionBehaviour):
         self.multisend_batches.append(
             MultisendBatch(
                 to=contract_address,
-                data=HexBytes(self.order_tx),
+                data=self.order_tx,
                 value=value,
             )
         )
@@ -248,7 +249,7 @@ class OrderSubscriptionBehaviour(BaseSubscriptionBehaviour):
         self.multisend_batches.append(
             MultisendBatch(
                 to=token,
-                data=HexBytes(self.approval_tx),
+                data=self.approval_tx,
             )
         )
         return True
@@ -353,11 +354,15 @@ class OrderSubscriptionBehaviour(BaseSubscriptionBehaviour):
         if not result:
             return SubscriptionRound.ERROR_PAYLOAD
 
-        for build_step in (
-            self._build_multisend_data,
-            self._build_multisend_safe_tx_hash,
-        ):
-            yield from self.wait_for_condition_with_sleep(build_step)
+        # the multisend data preparation does not interact with the chain,
+        # so a failure is deterministic and not worth retrying with backoff sleeps
+        result = yield from self._build_multisend_data()
+        if not result:
+            return SubscriptionRound.ERROR_PAYLOAD
+
+        yield from self.wait_for_condition_with_sleep(
+            self._build_multisend_safe_tx_hash
+        )
 
         return cast(str, self.tx_hex)
 
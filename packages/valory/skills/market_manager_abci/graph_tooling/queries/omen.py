@@ -22,21 +22,22 @@
 from string import Template
 
 
-questions = Template(
-    """
-    {
+# a plain format string is preferred over a `Template` here,
+# as the latter re-parses the template via regex on every substitution
+questions = """
+    {{
       fixedProductMarketMakers(
-        where: {
-          creator_in: ${creators},
-          outcomeSlotCount: ${slot_count},
-          openingTimestamp_gt: ${opening_threshold},
-          language_in: ${languages},
+        where: {{
+          creator_in: {creators},
+          outcomeSlotCount: {slot_count},
+          openingTimestamp_gt: {opening_threshold},
+          language_in: {languages},
           isPendingArbitration: false
-        },
+        }},
         orderBy: creationTimestamp
         orderDirection: desc
         first: 1000
-      ){
+      ){{
         id
         title
         collateralToken
@@ -48,10 +49,9 @@ questions = Template(
         outcomeTokenMarginalPrices
         outcomes
         scaledLiquidityMeasure
-      }
-    }
+      }}
+    }}
     """
-)
 
 trades = Template(
     """
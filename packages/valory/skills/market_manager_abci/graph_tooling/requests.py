@@ -22,7 +22,8 @@
 
 import json
 from abc import ABC
-from enum import Enum, auto
+from enum import IntEnum, auto
+from functools import lru_cache
 from typing import Any, Dict, Generator, Iterator, List, Optional, Tuple, cast
 
 from web3 import Web3
@@ -54,23 +55,57 @@ from packages.valory.skills.market_manager_abci.rounds import SynchronizedData
 
 QUERY_BATCH_SIZE = 1000
 MAX_LOG_SIZE = 1000
+# for how long to keep skipping a creator which has stopped yielding markets, in seconds
+DEAD_CREATORS_REFRESH_INTERVAL = 60 * 60 * 24
 
 
 def to_content(query: str) -> bytes:
     """Convert the given query string to payload content, i.e., add it under a `queries` key and convert it to bytes."""
     finalized_query = {"query": query}
-    encoded_query = json.dumps(finalized_query, sort_keys=True).encode("utf-8")
+    encoded_query = json.dumps(finalized_query, separators=(",", ":")).encode("utf-8")
 
     return encoded_query
 
 
 def to_graphql_list(li: list) -> str:
     """Convert the given list to a string representing a list for a GraphQL query."""
-    return repr(li).replace("'", '"')
-
-
-class FetchStatus(Enum):
-    """The status of a fetch operation."""
+    return json.dumps(li, separators=(",", ":"))
+
+
+@lru_cache(maxsize=32)
+def _questions_query_template_bytes(
+    creators: Tuple[str, ...],
+    slot_count: int,
+    languages: str,
+) -> bytes:
+    """Build the encoded payload of a questions query, with a `%d` slot for the opening threshold.
+
+    Memoized, because apart from the opening threshold the query is constant per configuration.
+    The threshold is the only per-fetch variable and, being an integer, it can be spliced
+    directly into the already-encoded bytes via `bytes %`, which is a C fastpath.
+    This way, fetches skip the JSON plus UTF-8 encoding of the payload entirely.
+
+    :param creators: the creators to filter the questions with.
+    :param slot_count: the slot count to filter the questions with.
+    :param languages: the languages to filter the questions with, pre-serialized as a GraphQL list,
+        as they are a configuration constant.
+    :return: the encoded payload, with a `%d` slot for the opening threshold.
+    """
+    query = questions.format(
+        creators=to_graphql_list(list(creators)),
+        slot_count=slot_count,
+        opening_threshold="%d",
+        languages=languages,
+    )
+    return to_content(query)
+
+
+class FetchStatus(IntEnum):
+    """The status of a fetch operation.
+
+    An `IntEnum` is used, as its members are compared with C-level int
+    comparisons on the request dispatching path.
+    """
 
     SUCCESS = auto()
     IN_PROGRESS = auto()
@@ -81,6 +116,18 @@ class FetchStatus(Enum):
 class QueryingBehaviour(BaseBehaviour, ABC):
     """Abstract behaviour that implements subgraph querying functionality."""
 
+    # the private fields are slotted, as they are accessed on every pass through the request
+    # dispatching and response handling paths; slot descriptors are faster than `__dict__` lookups
+    # (the instances still carry a `__dict__` for the base behaviour's attributes)
+    __slots__ = (
+        "_call_failed",
+        "_fetch_status",
+        "_creators_iterator",
+        "_current_market",
+        "_current_creators",
+        "_languages_gql",
+    )
+
     def __init__(self, **kwargs: Any) -> None:
         """Initialize a querying behaviour."""
         super().__init__(**kwargs)
@@ -88,9 +135,34 @@ class QueryingBehaviour(BaseBehaviour, ABC):
         self._fetch_status: FetchStatus = FetchStatus.NONE
         self._creators_iterator: Iterator[
             Tuple[str, List[str]]
-        ] = self.params.creators_iterator
+        ] = self._endpoint_grouped_creators()
         self._current_market: str = ""
         self._current_creators: List[str] = []
+        # the languages are a configuration constant, so serialize them once
+        self._languages_gql: str = to_graphql_list(self.params.languages)
+
+    def _endpoint_grouped_creators(self) -> Iterator[Tuple[str, List[str]]]:
+        """Group the configured creators by their subgraph's endpoint.
+
+        Entries which share an endpoint are merged into a single entry,
+        so that their markets are fetched with one request instead of one per entry.
+        This is safe because, apart from the creators,
+        all the entries use the same filters for fetching the questions.
+
+        :return: an iterator of market per creators, holding one entry per endpoint.
+        """
+        grouped: Dict[str, Tuple[str, List[str]]] = {}
+        for market, creators in self.params.creators_iterator:
+            url = getattr(self.context, market).get_spec()["url"]
+            if url in grouped:
+                grouped[url][1].extend(creators)
+            else:
+                grouped[url] = (market, list(creators))
+        # deduplicate the creators to avoid wasted subgraph lookups,
+        # and sort them for deterministic query-cache keys
+        return iter(
+            (market, sorted(set(creators))) for market, creators in grouped.values()
+        )
 
     @property
     def params(self) -> MarketManagerParams:
@@ -118,6 +190,43 @@ class QueryingBehaviour(BaseBehaviour, ABC):
         """Get a subgraph by prediction market's name."""
         return getattr(self.context, self._current_market)
 
+    def _filter_dead_creators(self) -> None:
+        """Filter out the creators which have stopped yielding markets.
+
+        A creator which is known to have yielded no markets is skipped,
+        to avoid wasting a subgraph call on it,
+        until the refresh interval elapses and it is given another chance.
+        """
+        dead_since = self.shared_state.creators_dead_since
+        synced_time = self.synced_time
+        alive = []
+        for creator in self._current_creators:
+            ts = dead_since.get((self._current_market, creator))
+            if ts is not None and synced_time - ts <= DEAD_CREATORS_REFRESH_INTERVAL:
+                continue
+            alive.append(creator)
+        self._current_creators = alive
+
+    def _record_dead_creators(self, bets: Optional[list]) -> None:
+        """Record which of the queried creators have stopped yielding markets.
+
+        :param bets: the bets of the latest response. A failed response (`None`) says nothing about the creators.
+        """
+        if bets is None:
+            return
+
+        dead_since = self.shared_state.creators_dead_since
+        nonempty = {str(bet.get("creator", "")).lower() for bet in bets}
+        for creator in self._current_creators:
+            key = (self._current_market, creator)
+            if creator.lower() in nonempty:
+                dead_since.pop(key, None)
+            else:
+                # creators are only queried while unfiltered, so this is the time
+                # at which the creator was last confirmed dead; overwriting it
+                # re-arms the refresh interval after each empty re-check
+                dead_since[key] = self.synced_time
+
     def _prepare_fetching(self) -> bool:
         """Prepare for fetching a bet."""
         if self._fetch_status in (FetchStatus.SUCCESS, FetchStatus.NONE):
@@ -125,6 +234,11 @@ class QueryingBehaviour(BaseBehaviour, ABC):
             if res is None:
                 return False
             self._current_market, self._current_creators = res
+            self._filter_dead_creators()
+            if not self._current_creators:
+                # all of the entry's creators are known to be dead; skip to the next entry
+                self._fetch_status = FetchStatus.SUCCESS
+                return self._prepare_fetching()
 
         if self._fetch_status == FetchStatus.FAIL:
             return False
@@ -175,15 +289,15 @@ class QueryingBehaviour(BaseBehaviour, ABC):
         """Fetch questions from the current subgraph, for the current creators."""
         self._fetch_status = FetchStatus.IN_PROGRESS
 
-        query = questions.substitute(
-            creators=to_graphql_list(self._current_creators),
-            slot_count=self.params.slot_count,
-            opening_threshold=self.synced_time + self.params.opening_margin,
-            languages=to_graphql_list(self.params.languages),
+        template = _questions_query_template_bytes(
+            tuple(self._current_creators),
+            self.params.slot_count,
+            self._languages_gql,
         )
+        content = template % (self.synced_time + self.params.opening_margin)
 
         res_raw = yield from self.get_http_response(
-            content=to_content(query),
+            content=content,
             **self.current_subgraph.get_spec(),
         )
         res = self.current_subgraph.process_response(res_raw)
@@ -193,6 +307,7 @@ class QueryingBehaviour(BaseBehaviour, ABC):
             res,
             res_context="questions",
         )
+        self._record_dead_creators(bets)
 
         return bets
 
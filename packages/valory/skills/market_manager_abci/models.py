@@ -21,9 +21,10 @@
 """Custom objects for the MarketManager ABCI application."""
 
 import builtins
-from typing import Any, Dict, Iterator, List, Tuple
+from typing import Any, Dict, Iterator, List, Tuple, Type
 
 from packages.valory.protocols.http import HttpMessage
+from packages.valory.skills.abstract_round_abci.base import AbciApp
 from packages.valory.skills.abstract_round_abci.models import ApiSpecs, BaseParams
 from packages.valory.skills.abstract_round_abci.models import (
     BenchmarkTool as BaseBenchmarkTool,
@@ -43,7 +44,14 @@ BenchmarkTool = BaseBenchmarkTool
 class SharedState(BaseSharedState):
     """Keep the current shared state of the skill."""
 
-    abci_app_cls = MarketManagerAbciApp
+    abci_app_cls: Type[AbciApp] = MarketManagerAbciApp
+
+    def __init__(self, *args: Any, skill_context: Any = None, **kwargs: Any) -> None:
+        """Initialize the state."""
+        super().__init__(*args, skill_context=skill_context, **kwargs)
+        # `(market, creator)` pairs mapped to the synced time at which the creator last stopped yielding markets;
+        # used to avoid querying the subgraphs for creators with no recent activity
+        self.creators_dead_since: Dict[Tuple[str, str], int] = {}
 
 
 class Subgraph(ApiSpecs):
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2024 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+
+"""This module contains the tests for the graph tooling of the 'market_manager_abci' skill."""
+
+from typing import Dict, List, Optional, Tuple
+from unittest.mock import MagicMock
+
+from packages.valory.skills.market_manager_abci.graph_tooling.requests import (
+    DEAD_CREATORS_REFRESH_INTERVAL,
+    QueryingBehaviour,
+)
+
+
+MARKET = "omen_subgraph"
+CREATOR = "0xCreator"
+
+
+def dummy_behaviour(
+    creators: List[str],
+    dead_since: Dict[Tuple[str, str], int],
+    synced_time: int,
+) -> MagicMock:
+    """Create a dummy on which the dead creators' bookkeeping can be exercised unbound."""
+    dummy = MagicMock()
+    dummy._current_market = MARKET
+    dummy._current_creators = creators
+    dummy.shared_state.creators_dead_since = dead_since
+    dummy.synced_time = synced_time
+    return dummy
+
+
+def test_filter_skips_recently_dead_creators() -> None:
+    """Test that `_filter_dead_creators` skips creators within the refresh interval."""
+    dead_since = {(MARKET, CREATOR): 0}
+    dummy = dummy_behaviour(
+        [CREATOR, "0xAlive"], dead_since, DEAD_CREATORS_REFRESH_INTERVAL
+    )
+
+    QueryingBehaviour._filter_dead_creators(dummy)
+
+    assert dummy._current_creators == ["0xAlive"]
+
+
+def test_filter_requeries_after_refresh_interval() -> None:
+    """Test that `_filter_dead_creators` gives a dead creator another chance after the interval."""
+    dead_since = {(MARKET, CREATOR): 0}
+    dummy = dummy_behaviour([CREATOR], dead_since, DEAD_CREATORS_REFRESH_INTERVAL + 1)
+
+    QueryingBehaviour._filter_dead_creators(dummy)
+
+    assert dummy._current_creators == [CREATOR]
+
+
+def test_record_rearms_interval_on_empty_recheck() -> None:
+    """Test that `_record_dead_creators` refreshes the timestamp of a still-dead creator."""
+    recheck_time = DEAD_CREATORS_REFRESH_INTERVAL + 1
+    dead_since = {(MARKET, CREATOR): 0}
+    dummy = dummy_behaviour([CREATOR], dead_since, recheck_time)
+
+    QueryingBehaviour._record_dead_creators(dummy, [])
+
+    # the creator was re-confirmed dead, so the interval should restart from the re-check time
+    assert dead_since[(MARKET, CREATOR)] == recheck_time
+
+
+def test_record_revives_creator_yielding_bets_again() -> None:
+    """Test that `_record_dead_creators` forgets a creator which yields markets again."""
+    dead_since = {(MARKET, CREATOR): 0}
+    dummy = dummy_behaviour([CREATOR], dead_since, DEAD_CREATORS_REFRESH_INTERVAL + 1)
+
+    QueryingBehaviour._record_dead_creators(dummy, [{"creator": CREATOR.lower()}])
+
+    assert (MARKET, CREATOR) not in dead_since
+
+
+def test_record_ignores_failed_response() -> None:
+    """Test that `_record_dead_creators` does not update anything on a failed response."""
+    dead_since: Dict[Tuple[str, str], int] = {}
+    dummy = dummy_behaviour([CREATOR], dead_since, 0)
+    bets: Optional[list] = None
+
+    QueryingBehaviour._record_dead_creators(dummy, bets)
+
+    assert not dead_since
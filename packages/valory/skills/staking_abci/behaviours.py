@@ -197,6 +197,35 @@ class StakingInteractBaseBehaviour(BaseBehaviour, ABC):
             self.context.logger.info(msg)
             yield from self.sleep(self.params.staking_interaction_sleep_time)
 
+    def gather_conditions(
+        self, *condition_gens: Callable[[], WaitableConditionType]
+    ) -> Generator[None, None, None]:
+        """Wait for multiple independent conditions under a single retry loop.
+
+        The framework's message routing only allows a single in-flight request
+        per behaviour, so the conditions cannot be truly concurrent.
+        Grouping them under one loop still avoids the per-condition wrapper
+        overhead and sleep bookkeeping, and only retries the conditions
+        which have not been satisfied yet.
+
+        :param condition_gens: the generators of the conditions to wait for
+        :yield: None
+        """
+        pending = list(condition_gens)
+        while pending:
+            still_pending = []
+            for condition_gen in pending:
+                condition_satisfied = yield from condition_gen()
+                if not condition_satisfied:
+                    still_pending.append(condition_gen)
+            pending = still_pending
+            if pending:
+                msg = (
+                    f"Retrying in {self.params.staking_interaction_sleep_time} seconds."
+                )
+                self.context.logger.info(msg)
+                yield from self.sleep(self.params.staking_interaction_sleep_time)
+
     def default_error(
         self, contract_id: str, contract_callable: str, response_msg: ContractApiMessage
     ) -> None:
@@ -87,6 +87,19 @@ class SynchronizedData(TxSettlementSyncedData):
         return self._get_deserialized("participant_to_checkpoint")
 
 
+# resolved once, as the same names are reused across the class-body literals below
+_TX_SUBMITTER = get_name(SynchronizedData.tx_submitter)
+_MOST_VOTED_TX_HASH = get_name(SynchronizedData.most_voted_tx_hash)
+_SERVICE_STAKING_STATE = get_name(SynchronizedData.service_staking_state)
+_PARTICIPANT_TO_CHECKPOINT = get_name(SynchronizedData.participant_to_checkpoint)
+
+# the staking states which override the checkpoint round's done event
+_STATE_TO_EVENT: Dict[StakingState, Event] = {
+    StakingState.UNSTAKED: Event.SERVICE_NOT_STAKED,
+    StakingState.EVICTED: Event.SERVICE_EVICTED,
+}
+
+
 class CallCheckpointRound(CollectSameUntilThresholdRound):
     """A round for the checkpoint call preparation."""
 
@@ -94,11 +107,11 @@ class CallCheckpointRound(CollectSameUntilThresholdRound):
     done_event: Enum = Event.DONE
     no_majority_event: Enum = Event.NO_MAJORITY
     selection_key = (
-        get_name(SynchronizedData.tx_submitter),
-        get_name(SynchronizedData.most_voted_tx_hash),
-        get_name(SynchronizedData.service_staking_state),
+        _TX_SUBMITTER,
+        _MOST_VOTED_TX_HASH,
+        _SERVICE_STAKING_STATE,
     )
-    collection_key = get_name(SynchronizedData.participant_to_checkpoint)
+    collection_key = _PARTICIPANT_TO_CHECKPOINT
     synchronized_data_class = SynchronizedData
 
     def end_block(self) -> Optional[Tuple[BaseSynchronizedData, Enum]]:
@@ -112,11 +125,9 @@ class CallCheckpointRound(CollectSameUntilThresholdRound):
         if event != Event.DONE:
             return res
 
-        if synced_data.service_staking_state == StakingState.UNSTAKED:
-            return synced_data, Event.SERVICE_NOT_STAKED
-
-        if synced_data.service_staking_state == StakingState.EVICTED:
-            return synced_data, Event.SERVICE_EVICTED
+        override = _STATE_TO_EVENT.get(synced_data.service_staking_state)
+        if override is not None:
+            return synced_data, override
 
         if synced_data.most_voted_tx_hash is None:
             return synced_data, Event.NEXT_CHECKPOINT_NOT_REACHED_YET
@@ -178,9 +189,7 @@ class StakingAbciApp(AbciApp[Event]):  # pylint: disable=too-few-public-methods
         FinishedStakingRound: {},
         ServiceEvictedRound: {},
     }
-    cross_period_persisted_keys = frozenset(
-        {get_name(SynchronizedData.service_staking_state)}
-    )
+    cross_period_persisted_keys = frozenset({_SERVICE_STAKING_STATE})
     final_states: Set[AppState] = {
         CheckpointCallPreparedRound,
         FinishedStakingRound,
@@ -192,14 +201,14 @@ class StakingAbciApp(AbciApp[Event]):  # pylint: disable=too-few-public-methods
     db_pre_conditions: Dict[AppState, Set[str]] = {CallCheckpointRound: set()}
     db_post_conditions: Dict[AppState, Set[str]] = {
         CheckpointCallPreparedRound: {
-            get_name(SynchronizedData.tx_submitter),
-            get_name(SynchronizedData.most_voted_tx_hash),
-            get_name(SynchronizedData.service_staking_state),
+            _TX_SUBMITTER,
+            _MOST_VOTED_TX_HASH,
+            _SERVICE_STAKING_STATE,
         },
         FinishedStakingRound: {
-            get_name(SynchronizedData.service_staking_state),
+            _SERVICE_STAKING_STATE,
         },
         ServiceEvictedRound: {
-            get_name(SynchronizedData.service_staking_state),
+            _SERVICE_STAKING_STATE,
         },
     }
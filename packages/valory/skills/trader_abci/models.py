@@ -27,6 +27,9 @@ from packages.valory.skills.abstract_round_abci.models import (
 )
 from packages.valory.skills.abstract_round_abci.models import Requests as BaseRequests
 from packages.valory.skills.check_stop_trading_abci.models import CheckStopTradingParams
+from packages.valory.skills.check_stop_trading_abci.models import (
+    SharedState as CheckStopTradingSharedState,
+)
 from packages.valory.skills.decision_maker_abci.models import (
     AccuracyInfoFields as BaseAccuracyInfoFields,
 )
@@ -114,7 +117,10 @@ class TraderParams(
     """A model to represent the trader params."""
 
 
-class SharedState(BaseSharedState):
+class SharedState(
+    BaseSharedState,
+    CheckStopTradingSharedState,  # It contains the staking values' cache
+):
     """Keep the current shared state of the skill."""
 
     abci_app_cls = TraderAbciApp
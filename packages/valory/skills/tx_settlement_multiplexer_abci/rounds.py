@@ -61,6 +61,17 @@ class Event(Enum):
     NO_MAJORITY = "no_majority"
 
 
+# computed once at import time, as rebuilding it on every block would also
+# re-derive the submitters' round ids in the hot path
+_SUBMITTER_TO_EVENT: Dict[str, Event] = {
+    MechRequestRound.auto_round_id(): Event.MECH_REQUESTING_DONE,
+    BetPlacementRound.auto_round_id(): Event.BET_PLACEMENT_DONE,
+    RedeemRound.auto_round_id(): Event.REDEEMING_DONE,
+    CallCheckpointRound.auto_round_id(): Event.STAKING_DONE,
+    SubscriptionRound.auto_round_id(): Event.SUBSCRIPTION_DONE,
+}
+
+
 class PreTxSettlementRound(VotingRound):
     """A round that will be called before the tx settlement."""
 
@@ -89,16 +100,12 @@ class PostTxSettlementRound(CollectSameUntilThresholdRound):
 
         :return: the synchronized data and the event, otherwise `None` if the round is still running.
         """
-        submitter_to_event: Dict[str, Event] = {
-            MechRequestRound.auto_round_id(): Event.MECH_REQUESTING_DONE,
-            BetPlacementRound.auto_round_id(): Event.BET_PLACEMENT_DONE,
-            RedeemRound.auto_round_id(): Event.REDEEMING_DONE,
-            CallCheckpointRound.auto_round_id(): Event.STAKING_DONE,
-            SubscriptionRound.auto_round_id(): Event.SUBSCRIPTION_DONE,
-        }
-
-        synced_data = SynchronizedData(self.synchronized_data.db)
-        event = submitter_to_event.get(synced_data.tx_submitter, Event.UNRECOGNIZED)
+        synced_data = self.synchronized_data
+        if not isinstance(synced_data, SynchronizedData):
+            # only re-wrap the db when the framework has not already normalized
+            # the attribute to the round's synchronized data class
+            synced_data = SynchronizedData(synced_data.db)
+        event = _SUBMITTER_TO_EVENT.get(synced_data.tx_submitter, Event.UNRECOGNIZED)
 
         # if a mech request was just performed, increase the utilized tool's counter
         if event == Event.MECH_REQUESTING_DONE: